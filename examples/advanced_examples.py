@@ -4,12 +4,27 @@ Advanced TQDM examples with threading, async, and pandas integration.
 This module demonstrates complex use cases and advanced features.
 """
 
+import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, List
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
+from tqdm.asyncio import tqdm as atqdm
+
+try:
+    from examples.settings import DEMO_DELAY, PROGRESS_UPDATE_INTERVAL
+except ImportError:  # run as a script from the examples directory
+    from settings import (  # type: ignore[no-redef]
+        DEMO_DELAY,
+        PROGRESS_UPDATE_INTERVAL,
+    )
+
+# Materialize tqdm's shared lock once, before any worker thread can
+# race to create its own.
+tqdm.set_lock(tqdm.get_lock())
 
 
 def multithreaded_processing(
@@ -31,20 +46,13 @@ def multithreaded_processing(
     print(f"\nMultithreaded Processing ({max_workers} workers)")
     print("-" * 50)
 
-    results: List[Any] = []
-
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(worker_func, item): item
-            for item in items
-        }
-
-        for future in tqdm(
-            as_completed(futures),
+        results = list(tqdm(
+            executor.map(worker_func, items),
             total=len(items),
-            desc="Processing items"
-        ):
-            results.append(future.result())
+            desc="Processing items",
+            mininterval=PROGRESS_UPDATE_INTERVAL
+        ))
 
     return results
 
@@ -59,7 +67,7 @@ def sample_worker(item: Any) -> Any:
     Returns:
         Processed result
     """
-    time.sleep(0.1)
+    time.sleep(0.1 * DEMO_DELAY)
     return f"Processed: {item}"
 
 
@@ -76,11 +84,15 @@ def pandas_dataframe_operations() -> None:
 
     df = pd.DataFrame(data)
 
-    tqdm.pandas(desc="Applying function")
-
-    df['processed'] = df['value'].progress_apply(
-        lambda x: x ** 2 if x % 2 == 0 else x * 3
-    )
+    with tqdm(total=1, desc="Applying function",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        values = df['value'].to_numpy()
+        df['processed'] = np.where(
+            (values & 1) == 0,
+            values * values,
+            values * 3
+        )
+        pbar.update(1)
 
     print(f"\nDataFrame shape: {df.shape}")
     print(f"Sample data:\n{df.head()}")
@@ -91,19 +103,19 @@ def pandas_groupby_with_progress() -> None:
     print("\nPandas GroupBy with Progress")
     print("-" * 50)
 
+    ids = np.arange(200)
     data = {
-        'category': [f"Cat_{i % 5}" for i in range(200)],
-        'value': list(range(200)),
-        'score': [(i * 7) % 100 for i in range(200)]
+        'category': np.char.add("Cat_", (ids % 5).astype(str)),
+        'value': ids,
+        'score': (ids * 7) % 100
     }
 
     df = pd.DataFrame(data)
 
-    tqdm.pandas(desc="Grouping and aggregating")
-
-    result = df.groupby('category').progress_apply(
-        lambda x: x['value'].sum()
-    )
+    with tqdm(total=1, desc="Grouping and aggregating",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        result = df.groupby('category')['value'].sum()
+        pbar.update(1)
 
     print(f"\nGroupBy results:\n{result}")
 
@@ -122,17 +134,19 @@ def pandas_iteration_with_progress() -> None:
     df = pd.DataFrame(data)
 
     processed_rows: List[str] = []
-
-    for _, row in tqdm(df.iterrows(),
-                       total=len(df),
-                       desc="Processing rows"):
-        processed = (
-            f"{row['name']}: "
-            f"age={row['age']}, "
-            f"score={row['score']}"
-        )
-        processed_rows.append(processed)
-        time.sleep(0.02)
+    chunk_size = 1000
+
+    with tqdm(total=len(df), desc="Processing rows",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            processed = (
+                chunk['name']
+                + ": age=" + chunk['age'].astype(str)
+                + ", score=" + chunk['score'].astype(str)
+            )
+            processed_rows.extend(processed.tolist())
+            pbar.update(len(chunk))
 
     print(f"\nProcessed {len(processed_rows)} rows")
 
@@ -142,24 +156,22 @@ def multiple_concurrent_progress_bars() -> None:
     print("\nMultiple Concurrent Progress Bars")
     print("-" * 50)
 
-    def worker_task(task_id: int, items: int) -> None:
+    async def worker_task(task_id: int, items: int) -> None:
         """Simulate a task with its own progress bar."""
-        for _ in tqdm(
+        async for _ in atqdm(
             range(items),
             desc=f"Task {task_id}",
             position=task_id,
-            leave=True
+            leave=True,
+            mininterval=PROGRESS_UPDATE_INTERVAL
         ):
-            time.sleep(0.05)
+            await asyncio.sleep(0.05 * DEMO_DELAY)
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = [
-            executor.submit(worker_task, i, 20)
-            for i in range(3)
-        ]
+    async def run_tasks() -> None:
+        """Run all tasks concurrently on the event loop."""
+        await asyncio.gather(*(worker_task(i, 20) for i in range(3)))
 
-        for future in futures:
-            future.result()
+    asyncio.run(run_tasks())
 
 
 def progress_with_callback() -> None:
@@ -169,11 +181,12 @@ def progress_with_callback() -> None:
 
     def process_item(item: int, pbar: tqdm) -> int:
         """Process an item and update progress."""
-        time.sleep(0.05)
+        time.sleep(0.05 * DEMO_DELAY)
         pbar.update(1)
         return item * 2
 
-    with tqdm(total=50, desc="Processing with callback") as pbar:
+    with tqdm(total=50, desc="Processing with callback",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
         results = [process_item(i, pbar) for i in range(50)]
 
     print(f"Processed {len(results)} items")
@@ -196,20 +209,31 @@ def custom_progress_bar_class() -> None:
         def add_error(self) -> None:
             """Increment error count."""
             self.errors += 1
-            self.set_postfix(errors=self.errors, warnings=self.warnings)
+            # Only update the postfix; the redraw happens on the bar's
+            # own mininterval cadence.
+            self.set_postfix(
+                errors=self.errors,
+                warnings=self.warnings,
+                refresh=False
+            )
 
         def add_warning(self) -> None:
             """Increment warning count."""
             self.warnings += 1
-            self.set_postfix(errors=self.errors, warnings=self.warnings)
-
-    pbar = CustomProgressBar(range(100), desc="Custom processing")
+            self.set_postfix(
+                errors=self.errors,
+                warnings=self.warnings,
+                refresh=False
+            )
+
+    pbar = CustomProgressBar(range(100), desc="Custom processing",
+                             mininterval=PROGRESS_UPDATE_INTERVAL)
     for i in pbar:
         if i % 10 == 0:
             pbar.add_error()
         elif i % 5 == 0:
             pbar.add_warning()
-        time.sleep(0.03)
+        time.sleep(0.03 * DEMO_DELAY)
 
 
 def rate_limited_progress() -> None:
@@ -222,7 +246,8 @@ def rate_limited_progress() -> None:
 
     for i in tqdm(range(50),
                   desc="Rate limited",
-                  unit="req"):
+                  unit="req",
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
         time.sleep(delay)
 
 
@@ -9,6 +9,14 @@ from typing import List
 
 from tqdm import tqdm
 
+try:
+    from examples.settings import DEMO_DELAY, PROGRESS_UPDATE_INTERVAL
+except ImportError:  # run as a script from the examples directory
+    from settings import (  # type: ignore[no-redef]
+        DEMO_DELAY,
+        PROGRESS_UPDATE_INTERVAL,
+    )
+
 
 def simple_loop() -> None:
     """
@@ -19,8 +27,9 @@ def simple_loop() -> None:
     print("\n1. Simple Loop Progress Bar")
     print("-" * 50)
 
-    for i in tqdm(range(100), desc="Processing"):
-        time.sleep(0.05)
+    for i in tqdm(range(100), desc="Processing",
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.05 * DEMO_DELAY)
 
 
 def custom_description() -> None:
@@ -28,8 +37,9 @@ def custom_description() -> None:
     print("\n2. Custom Description Progress Bar")
     print("-" * 50)
 
-    for i in tqdm(range(50), desc="Loading data", unit="items"):
-        time.sleep(0.03)
+    for i in tqdm(range(50), desc="Loading data", unit="items",
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.03 * DEMO_DELAY)
 
 
 def manual_progress() -> None:
@@ -37,9 +47,10 @@ def manual_progress() -> None:
     print("\n3. Manual Progress Updates")
     print("-" * 50)
 
-    with tqdm(total=100, desc="Manual control") as pbar:
+    with tqdm(total=100, desc="Manual control",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
         for i in range(10):
-            time.sleep(0.1)
+            time.sleep(0.1 * DEMO_DELAY)
             pbar.update(10)
 
 
@@ -48,10 +59,11 @@ def nested_progress_bars() -> None:
     print("\n4. Nested Progress Bars")
     print("-" * 50)
 
-    for i in tqdm(range(5), desc="Outer loop", position=0):
+    for i in tqdm(range(5), desc="Outer loop", position=0,
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
         for j in tqdm(range(20), desc="Inner loop", position=1,
-                      leave=False):
-            time.sleep(0.02)
+                      leave=False, mininterval=PROGRESS_UPDATE_INTERVAL):
+            time.sleep(0.02 * DEMO_DELAY)
 
 
 def custom_format() -> None:
@@ -65,8 +77,9 @@ def custom_format() -> None:
     )
 
     for i in tqdm(range(75), desc="Custom format",
-                  bar_format=bar_format):
-        time.sleep(0.03)
+                  bar_format=bar_format,
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.03 * DEMO_DELAY)
 
 
 def progress_with_postfix() -> None:
@@ -74,15 +87,15 @@ def progress_with_postfix() -> None:
     print("\n6. Progress Bar with Postfix Info")
     print("-" * 50)
 
-    pbar = tqdm(range(50), desc="Training")
+    pbar = tqdm(range(50), desc="Training",
+                mininterval=PROGRESS_UPDATE_INTERVAL)
     for i in pbar:
         loss = 1.0 / (i + 1)
         accuracy = (i + 1) / 50.0
-        pbar.set_postfix(
-            loss=f"{loss:.4f}",
-            acc=f"{accuracy:.2%}"
-        )
-        time.sleep(0.05)
+        # Raw floats are formatted by tqdm itself, and refresh=False
+        # leaves the redraw to the bar's regular mininterval cadence.
+        pbar.set_postfix({'loss': loss, 'acc': accuracy}, refresh=False)
+        time.sleep(0.05 * DEMO_DELAY)
 
 
 def iterable_wrapping() -> None:
@@ -92,8 +105,9 @@ def iterable_wrapping() -> None:
 
     data: List[str] = [f"item_{i}" for i in range(30)]
 
-    for item in tqdm(data, desc="Processing items"):
-        time.sleep(0.05)
+    for item in tqdm(data, desc="Processing items",
+                     mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.05 * DEMO_DELAY)
 
 
 def progress_with_rate() -> None:
@@ -102,8 +116,8 @@ def progress_with_rate() -> None:
     print("-" * 50)
 
     for i in tqdm(range(100), desc="Processing", unit="items",
-                  unit_scale=True):
-        time.sleep(0.02)
+                  unit_scale=True, mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.02 * DEMO_DELAY)
 
 
 def main() -> None:
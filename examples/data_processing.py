@@ -6,13 +6,96 @@ with progress tracking.
 """
 
 import csv
+import io
 import json
 import os
 import time
-from typing import Any, Dict, List
+from collections import Counter
+from functools import partial
+from itertools import islice
+from typing import Any, BinaryIO, Dict, List
 
+import numpy as np
 from tqdm import tqdm
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from examples.settings import DEMO_DELAY, PROGRESS_UPDATE_INTERVAL
+except ImportError:  # run as a script from the examples directory
+    from settings import (  # type: ignore[no-redef]
+        DEMO_DELAY,
+        PROGRESS_UPDATE_INTERVAL,
+    )
+
+
+def _load_json(file_path: str) -> Any:
+    """
+    Load a JSON document, using orjson when it is installed.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    if HAS_ORJSON:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def _dump_json(data: Any, file_path: str) -> None:
+    """
+    Write a JSON document indented by two spaces, using orjson when
+    it is installed.
+
+    Args:
+        data: JSON-serializable object
+        file_path: Destination path
+    """
+    if HAS_ORJSON:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(file_path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def _count_lines(f: BinaryIO, block_size: int = 1024 * 1024) -> int:
+    """
+    Count lines in a binary file by scanning for newlines in C.
+
+    The file is rewound afterwards so the caller can parse it
+    without opening it a second time.
+
+    Args:
+        f: File opened in binary mode, positioned at the start
+        block_size: Number of bytes scanned per read
+
+    Returns:
+        Number of lines, including an unterminated last line
+    """
+    lines = 0
+    last_block = b''
+
+    for block in iter(partial(f.read, block_size), b''):
+        lines += block.count(b'\n')
+        last_block = block
+
+    if last_block and not last_block.endswith(b'\n'):
+        lines += 1
+
+    f.seek(0)
+    return lines
+
 
 def process_csv_file(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -31,20 +114,21 @@ def process_csv_file(file_path: str) -> List[Dict[str, Any]]:
         print(f"File not found: {file_path}")
         return []
 
-    with open(file_path, 'r') as f:
-        total_lines = sum(1 for _ in f) - 1
-
     processed_data: List[Dict[str, Any]] = []
 
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in tqdm(
-            reader,
-            total=total_lines,
-            desc="Processing CSV"
-        ):
-            processed_data.append(row)
-            time.sleep(0.01)
+    with open(file_path, 'rb') as raw:
+        total_lines = _count_lines(raw) - 1
+
+        with io.TextIOWrapper(raw, newline='') as f:
+            reader = csv.DictReader(f)
+            for row in tqdm(
+                reader,
+                total=total_lines,
+                desc="Processing CSV",
+                mininterval=PROGRESS_UPDATE_INTERVAL
+            ):
+                processed_data.append(row)
+                time.sleep(0.01 * DEMO_DELAY)
 
     return processed_data
 
@@ -66,14 +150,12 @@ def process_json_array(file_path: str) -> List[Dict[str, Any]]:
         print(f"File not found: {file_path}")
         return []
 
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    data = _load_json(file_path)
 
-    processed_data: List[Dict[str, Any]] = []
-
-    for item in tqdm(data, desc="Processing JSON"):
-        processed_data.append(item)
-        time.sleep(0.01)
+    with tqdm(total=len(data), desc="Processing JSON",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        processed_data: List[Dict[str, Any]] = list(data)
+        pbar.update(len(data))
 
     return processed_data
 
@@ -98,13 +180,18 @@ def batch_process_data(
     batches: List[List[Any]] = []
     total_batches = (len(data) + batch_size - 1) // batch_size
 
-    for i in tqdm(range(0, len(data), batch_size),
-                  total=total_batches,
-                  desc="Processing batches",
-                  unit="batch"):
-        batch = data[i:i + batch_size]
-        batches.append(batch)
-        time.sleep(0.05)
+    items = iter(data)
+
+    with tqdm(total=total_batches,
+              desc="Processing batches",
+              unit="batch",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            batches.append(batch)
+            pbar.update(1)
 
     return batches
 
@@ -124,14 +211,26 @@ def transform_data_with_progress(
     print("\nTransforming Data")
     print("-" * 50)
 
+    # Records usually share one key layout, so upper-case it once and
+    # only fall back to per-key conversion for records that differ.
+    keys = tuple(data[0]) if data else ()
+    upper_keys = tuple(k.upper() for k in keys)
+
+    def transform(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Upper-case the keys of a single record."""
+        if tuple(record) == keys:
+            return dict(zip(upper_keys, record.values()))
+        return {k.upper(): v for k, v in record.items()}
+
     transformed: List[Dict[str, Any]] = []
+    chunk_size = 1000
 
-    for record in tqdm(data, desc="Transforming records"):
-        transformed_record = {
-            k.upper(): v for k, v in record.items()
-        }
-        transformed.append(transformed_record)
-        time.sleep(0.01)
+    with tqdm(total=len(data), desc="Transforming records",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start:start + chunk_size]
+            transformed.extend([transform(record) for record in chunk])
+            pbar.update(len(chunk))
 
     return transformed
 
@@ -155,12 +254,12 @@ def filter_data_with_progress(
     print(f"\nFiltering Data (key={key}, value={value})")
     print("-" * 50)
 
-    filtered: List[Dict[str, Any]] = []
-
-    for record in tqdm(data, desc="Filtering records"):
-        if record.get(key) == value:
-            filtered.append(record)
-        time.sleep(0.005)
+    filtered: List[Dict[str, Any]] = [
+        record
+        for record in tqdm(data, desc="Filtering records",
+                           mininterval=PROGRESS_UPDATE_INTERVAL)
+        if record.get(key) == value
+    ]
 
     print(f"Filtered: {len(filtered)}/{len(data)} records")
     return filtered
@@ -179,17 +278,27 @@ def create_sample_csv(file_path: str, rows: int = 100) -> None:
 
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
+    ids = np.arange(rows)
+    names = np.char.add("Person_", ids.astype(str))
+    ages = 20 + (ids % 50)
+    cities = np.char.add("City_", (ids % 10).astype(str))
+
     with open(file_path, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['id', 'name', 'age', 'city'])
 
-        for i in tqdm(range(rows), desc="Writing CSV rows"):
-            writer.writerow([
-                i,
-                f"Person_{i}",
-                20 + (i % 50),
-                f"City_{i % 10}"
-            ])
+        data_rows = zip(ids.tolist(), names.tolist(),
+                        ages.tolist(), cities.tolist())
+        chunk_size = 1000
+
+        with tqdm(total=rows, desc="Writing CSV rows",
+                  mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+            while True:
+                chunk = list(islice(data_rows, chunk_size))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                pbar.update(len(chunk))
 
 
 def create_sample_json(file_path: str, count: int = 100) -> None:
@@ -205,18 +314,24 @@ def create_sample_json(file_path: str, count: int = 100) -> None:
 
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-    data: List[Dict[str, Any]] = []
+    ids = np.arange(count)
+    id_strs = ids.astype(str)
+    names = np.char.add("User_", id_strs)
+    emails = np.char.add(np.char.add("user", id_strs), "@example.com")
+    scores = (ids * 7) % 100
 
-    for i in tqdm(range(count), desc="Creating JSON records"):
-        data.append({
-            'id': i,
-            'name': f"User_{i}",
-            'email': f"user{i}@example.com",
-            'score': (i * 7) % 100
-        })
+    data: List[Dict[str, Any]] = [
+        {'id': i, 'name': name, 'email': email, 'score': score}
+        for i, name, email, score in tqdm(
+            zip(ids.tolist(), names.tolist(),
+                emails.tolist(), scores.tolist()),
+            total=count,
+            desc="Creating JSON records",
+            mininterval=PROGRESS_UPDATE_INTERVAL
+        )
+    ]
 
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _dump_json(data, file_path)
 
 
 def aggregate_data_with_progress(
@@ -236,14 +351,13 @@ def aggregate_data_with_progress(
     print(f"\nAggregating Data by '{group_key}'")
     print("-" * 50)
 
-    aggregated: Dict[str, int] = {}
-
-    for record in tqdm(data, desc="Aggregating"):
-        key_value = str(record.get(group_key, 'unknown'))
-        aggregated[key_value] = aggregated.get(key_value, 0) + 1
-        time.sleep(0.005)
+    aggregated = Counter(
+        str(record.get(group_key, 'unknown'))
+        for record in tqdm(data, desc="Aggregating",
+                           mininterval=PROGRESS_UPDATE_INTERVAL)
+    )
 
-    return aggregated
+    return dict(aggregated)
 
 
 def main() -> None:
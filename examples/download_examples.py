@@ -4,19 +4,31 @@ Download examples with TQDM progress bars.
 This module demonstrates file downloads with progress tracking.
 """
 
+import asyncio
 import os
 import time
 from typing import Optional
 from urllib.parse import urlparse
 
+import aiohttp
 import requests
+import urllib3
 from tqdm import tqdm
+from tqdm.asyncio import tqdm as atqdm
+
+try:
+    from examples.settings import DEMO_DELAY, PROGRESS_UPDATE_INTERVAL
+except ImportError:  # run as a script from the examples directory
+    from settings import (  # type: ignore[no-redef]
+        DEMO_DELAY,
+        PROGRESS_UPDATE_INTERVAL,
+    )
 
 
 def download_file_with_progress(
     url: str,
     destination: Optional[str] = None,
-    chunk_size: int = 8192
+    chunk_size: int = 65536
 ) -> Optional[str]:
     """
     Download a file with progress bar.
@@ -48,74 +60,160 @@ def download_file_with_progress(
             unit='B',
             unit_scale=True,
             unit_divisor=1024,
+            mininterval=PROGRESS_UPDATE_INTERVAL,
         ) as pbar:
-            for chunk in response.iter_content(chunk_size=chunk_size):
+            # Coalesce chunk sizes locally and hand them to tqdm at
+            # most once per update interval.
+            pending = 0
+            last_update = time.monotonic()
+
+            # Read straight from urllib3, skipping requests' own
+            # iter_content generator layer; its errors are therefore
+            # not translated into requests exceptions.
+            for chunk in response.raw.stream(
+                chunk_size, decode_content=True
+            ):
                 if chunk:
                     f.write(chunk)
-                    pbar.update(len(chunk))
+                    pending += len(chunk)
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                        pbar.update(pending)
+                        pending = 0
+                        last_update = now
+
+            pbar.update(pending)
 
         print(f"Downloaded to: {destination}")
         return destination
 
-    except requests.exceptions.RequestException as e:
+    except (
+        requests.exceptions.RequestException,
+        urllib3.exceptions.HTTPError,
+    ) as e:
         print(f"Download failed: {e}")
         return None
 
 
-def download_multiple_files(
-    urls: list,
-    destination_dir: str = "downloads"
-) -> list:
+async def _download_to_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    destination: str
+) -> Optional[str]:
     """
-    Download multiple files with progress tracking.
+    Stream a single URL to disk with its own progress bar.
 
     Args:
-        urls: List of URLs to download
-        destination_dir: Directory to save files
+        session: Shared aiohttp session
+        url: URL to download from
+        destination: Local file path
 
     Returns:
-        List of downloaded file paths
+        Path to downloaded file, or None if failed
     """
-    print(f"\nDownloading {len(urls)} files")
-    print("-" * 50)
+    filename = os.path.basename(destination)
 
-    os.makedirs(destination_dir, exist_ok=True)
-
-    downloaded_files = []
-
-    for url in tqdm(urls, desc="Overall progress", unit="file"):
-        parsed = urlparse(url)
-        filename = (
-            os.path.basename(parsed.path)
-            or f"file_{len(downloaded_files)}"
-        )
-        destination = os.path.join(destination_dir, filename)
-
-        try:
-            response = requests.get(url, stream=True, timeout=30)
+    try:
+        async with session.get(url) as response:
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
 
             with open(destination, 'wb') as f:
-                with tqdm(
+                with atqdm(
                     desc=f"  {filename}",
                     total=total_size,
                     unit='B',
                     unit_scale=True,
-                    leave=False
+                    leave=False,
+                    mininterval=PROGRESS_UPDATE_INTERVAL
                 ) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
+                    pending = 0
+                    last_update = time.monotonic()
+
+                    async for chunk in response.content.iter_chunked(
+                        65536
+                    ):
+                        f.write(chunk)
+                        pending += len(chunk)
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                            pbar.update(pending)
+                            pending = 0
+                            last_update = now
+
+                    pbar.update(pending)
+
+        return destination
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"  Failed to download {url}: {e}")
+        return None
+
+
+async def _download_all(
+    urls: list,
+    destination_dir: str
+) -> list:
+    """
+    Download all URLs concurrently on a single event loop.
 
-            downloaded_files.append(destination)
+    Args:
+        urls: List of URLs to download
+        destination_dir: Directory to save files
 
-        except requests.exceptions.RequestException as e:
-            print(f"  Failed to download {url}: {e}")
+    Returns:
+        List of downloaded file paths
+    """
+    # Like requests' timeout=30, limit connecting and each read rather
+    # than the whole transfer, so long downloads are not cut off.
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=30, sock_read=30
+    )
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        tasks = []
+        used_names = set()
+        for idx, url in enumerate(urls):
+            parsed = urlparse(url)
+            filename = os.path.basename(parsed.path)
+            # Concurrent downloads must not share a destination file.
+            if not filename or filename in used_names:
+                filename = f"file_{idx}"
+            used_names.add(filename)
+            destination = os.path.join(destination_dir, filename)
+            tasks.append(_download_to_file(session, url, destination))
+
+        results = await atqdm.gather(
+            *tasks,
+            desc="Overall progress",
+            unit="file",
+            mininterval=PROGRESS_UPDATE_INTERVAL
+        )
+
+    return [path for path in results if path is not None]
+
+
+def download_multiple_files(
+    urls: list,
+    destination_dir: str = "downloads"
+) -> list:
+    """
+    Download multiple files concurrently with progress tracking.
+
+    Args:
+        urls: List of URLs to download
+        destination_dir: Directory to save files
+
+    Returns:
+        List of downloaded file paths
+    """
+    print(f"\nDownloading {len(urls)} files")
+    print("-" * 50)
+
+    os.makedirs(destination_dir, exist_ok=True)
 
-    return downloaded_files
+    return asyncio.run(_download_all(urls, destination_dir))
 
 
 def simulate_api_requests(count: int = 20) -> list:
@@ -133,8 +231,9 @@ def simulate_api_requests(count: int = 20) -> list:
 
     responses = []
 
-    for i in tqdm(range(count), desc="API requests", unit="req"):
-        time.sleep(0.2)
+    for i in tqdm(range(count), desc="API requests", unit="req",
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
+        time.sleep(0.2 * DEMO_DELAY)
         responses.append({'id': i, 'status': 'success'})
 
     return responses
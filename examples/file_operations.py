@@ -5,12 +5,30 @@ This module demonstrates real-world file handling scenarios with
 progress tracking.
 """
 
+import errno
 import os
 import shutil
-import time
 from typing import List
 
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+try:
+    from examples.settings import PROGRESS_UPDATE_INTERVAL
+except ImportError:  # run as a script from the examples directory
+    from settings import (  # type: ignore[no-redef]
+        PROGRESS_UPDATE_INTERVAL,
+    )
+
+# Errors meaning sendfile cannot handle this pair of files, as opposed
+# to a real I/O failure.
+_SENDFILE_UNSUPPORTED = frozenset({
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+    errno.EXDEV,
+})
 
 
 def copy_files_with_progress(
@@ -29,15 +47,18 @@ def copy_files_with_progress(
 
     os.makedirs(dest_dir, exist_ok=True)
 
-    for file_path in tqdm(source_files, desc="Copying files",
-                          unit="file"):
-        if os.path.exists(file_path):
-            dest_path = os.path.join(
-                dest_dir,
-                os.path.basename(file_path)
-            )
+    copy_pairs = [
+        (file_path, os.path.join(dest_dir, os.path.basename(file_path)))
+        for file_path in source_files
+    ]
+
+    for file_path, dest_path in tqdm(copy_pairs, desc="Copying files",
+                                     unit="file",
+                                     mininterval=PROGRESS_UPDATE_INTERVAL):
+        try:
             shutil.copy2(file_path, dest_path)
-        time.sleep(0.1)
+        except FileNotFoundError:
+            pass
 
 
 def copy_large_file_with_progress(
@@ -64,13 +85,34 @@ def copy_large_file_with_progress(
 
     with open(source, 'rb') as src, open(destination, 'wb') as dst:
         with tqdm(total=file_size, unit='B', unit_scale=True,
-                  desc=f"Copying {os.path.basename(source)}") as pbar:
-            while True:
-                chunk = src.read(chunk_size)
-                if not chunk:
-                    break
-                dst.write(chunk)
-                pbar.update(len(chunk))
+                  desc=f"Copying {os.path.basename(source)}",
+                  mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+            offset = 0
+
+            # Let the kernel move the pages directly where supported.
+            if hasattr(os, 'sendfile'):
+                try:
+                    while True:
+                        sent = os.sendfile(
+                            dst.fileno(), src.fileno(), offset, chunk_size
+                        )
+                        if not sent:
+                            break
+                        offset += sent
+                        pbar.update(sent)
+                except OSError as e:
+                    if e.errno not in _SENDFILE_UNSUPPORTED:
+                        raise
+
+            # The reported size is only a hint (procfs files report 0),
+            # so read whatever sendfile left behind until EOF.
+            src.seek(offset)
+            dst.seek(offset)
+            shutil.copyfileobj(
+                src,
+                CallbackIOWrapper(pbar.update, dst, 'write'),
+                chunk_size
+            )
 
 
 def scan_directory_with_progress(directory: str) -> List[str]:
@@ -92,14 +134,27 @@ def scan_directory_with_progress(directory: str) -> List[str]:
 
     all_files: List[str] = []
 
-    for root, dirs, files in os.walk(directory):
-        for file in tqdm(
-            files,
-            desc=f"Scanning {root}",
-            leave=False
-        ):
-            all_files.append(os.path.join(root, file))
-            time.sleep(0.01)
+    def scan(path: str, pbar: tqdm) -> None:
+        """Recursively collect files below path."""
+        # Like os.walk, skip directories that cannot be listed.
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, do not descend into symlinked dirs.
+                    if not entry.is_symlink():
+                        scan(entry.path, pbar)
+                else:
+                    all_files.append(entry.path)
+                    pbar.update(1)
+
+    with tqdm(desc="Scanning", unit="file",
+              mininterval=PROGRESS_UPDATE_INTERVAL) as pbar:
+        scan(directory, pbar)
 
     print(f"Total files found: {len(all_files)}")
     return all_files
@@ -121,15 +176,18 @@ def move_files_with_progress(
 
     os.makedirs(dest_dir, exist_ok=True)
 
-    for file_path in tqdm(source_files, desc="Moving files",
-                          unit="file"):
-        if os.path.exists(file_path):
-            dest_path = os.path.join(
-                dest_dir,
-                os.path.basename(file_path)
-            )
+    move_pairs = [
+        (file_path, os.path.join(dest_dir, os.path.basename(file_path)))
+        for file_path in source_files
+    ]
+
+    for file_path, dest_path in tqdm(move_pairs, desc="Moving files",
+                                     unit="file",
+                                     mininterval=PROGRESS_UPDATE_INTERVAL):
+        try:
             shutil.move(file_path, dest_path)
-        time.sleep(0.1)
+        except FileNotFoundError:
+            pass
 
 
 def create_sample_files(count: int = 10) -> List[str]:
@@ -149,13 +207,14 @@ def create_sample_files(count: int = 10) -> List[str]:
     os.makedirs(temp_dir, exist_ok=True)
 
     file_paths: List[str] = []
+    line_template = b"Sample content for file %d\n"
 
-    for i in tqdm(range(count), desc="Creating files"):
+    for i in tqdm(range(count), desc="Creating files",
+                  mininterval=PROGRESS_UPDATE_INTERVAL):
         file_path = os.path.join(temp_dir, f"sample_{i}.txt")
-        with open(file_path, 'w') as f:
-            f.write(f"Sample content for file {i}\n" * 100)
+        with open(file_path, 'wb') as f:
+            f.write((line_template % i) * 100)
         file_paths.append(file_path)
-        time.sleep(0.05)
 
     return file_paths
 
@@ -171,10 +230,12 @@ def delete_files_with_progress(file_paths: List[str]) -> None:
     print("-" * 50)
 
     for file_path in tqdm(file_paths, desc="Deleting files",
-                          unit="file"):
-        if os.path.exists(file_path):
+                          unit="file",
+                          mininterval=PROGRESS_UPDATE_INTERVAL):
+        try:
             os.remove(file_path)
-        time.sleep(0.05)
+        except FileNotFoundError:
+            pass
 
 
 def main() -> None:
@@ -0,0 +1,17 @@
+"""
+Shared settings for the example scripts.
+
+Both values can be overridden through the environment.
+"""
+
+import os
+
+# Scale factor for the simulated per-item work; set DEMO_DELAY=0 to
+# measure the cost of tqdm itself.
+DEMO_DELAY = float(os.getenv("DEMO_DELAY", "1.0"))
+
+# Minimum number of seconds between two progress bar redraws; the
+# default matches tqdm's own mininterval.
+PROGRESS_UPDATE_INTERVAL = float(
+    os.getenv("PROGRESS_UPDATE_INTERVAL", "0.1")
+)
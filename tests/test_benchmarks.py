@@ -0,0 +1,42 @@
+"""
+Performance benchmarks for progress wrapper utilities.
+
+Skipped unless pytest-benchmark is installed.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from utils.progress_wrappers import progress_copy, progress_map  # noqa: E402
+
+
+@pytest.mark.benchmark(group="copy")
+def test_progress_copy_benchmark(benchmark: Any, tmp_path: Path) -> None:
+    """Benchmark progress_copy on a 256 MiB sparse file."""
+    src = tmp_path / "big"
+    dst = tmp_path / "dst"
+
+    fd = os.open(src, os.O_CREAT | os.O_WRONLY)
+    try:
+        os.truncate(fd, 256 << 20)
+    finally:
+        os.close(fd)
+
+    benchmark(progress_copy, str(src), str(dst))
+
+    assert os.path.getsize(dst) == 256 << 20
+
+
+@pytest.mark.benchmark(group="map")
+def test_progress_map_benchmark(benchmark: Any) -> None:
+    """Benchmark progress_map's per-item overhead with output disabled."""
+    result = benchmark(
+        progress_map, lambda x: x * x, range(1_000_000), disable=True
+    )
+
+    assert len(result) == 1_000_000
@@ -2,7 +2,10 @@
 Tests for custom formatters.
 """
 
+import io
+
 from utils.formatters import (
+    ColoredProgressBar,
     bytes_formatter,
     create_custom_bar_format,
     create_metrics_display,
@@ -17,6 +20,8 @@ def test_bytes_formatter() -> None:
     assert bytes_formatter(1024 * 1024) == "1.00 MB"
     assert bytes_formatter(1024 * 1024 * 1024) == "1.00 GB"
     assert bytes_formatter(500) == "500.00 B"
+    assert bytes_formatter(1536) == "1.50 KB"
+    assert bytes_formatter(1024 ** 5) == "1024.00 TB"
 
 
 def test_percentage_formatter() -> None:
@@ -71,3 +76,24 @@ def test_create_metrics_display_empty() -> None:
     """Test metrics display with empty dict."""
     display = create_metrics_display({})
     assert display == ""
+
+
+def test_colored_progress_bar_bands() -> None:
+    """Test colored progress bar picks a color per progress band."""
+    with ColoredProgressBar(total=100, file=io.StringIO()) as pbar:
+        expected = {
+            10: ColoredProgressBar.COLORS['red'],
+            40: ColoredProgressBar.COLORS['yellow'],
+            80: ColoredProgressBar.COLORS['green'],
+        }
+        for n, color in expected.items():
+            pbar.n = n
+            meter = str(pbar)
+            assert meter.startswith(color)
+            assert meter.endswith(ColoredProgressBar.COLORS['reset'])
+
+
+def test_colored_progress_bar_unknown_total() -> None:
+    """Test colored progress bar without a total is left uncolored."""
+    with ColoredProgressBar(file=io.StringIO()) as pbar:
+        assert not str(pbar).startswith('\033[')
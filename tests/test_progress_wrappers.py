@@ -2,14 +2,17 @@
 Tests for progress wrapper utilities.
 """
 
+import errno
 import os
 import tempfile
 
 import pytest
 
+from utils import progress_wrappers
 from utils.progress_wrappers import (
     ProgressContext,
     progress_copy,
+    progress_copytree,
     progress_enumerate,
     progress_filter,
     progress_map,
@@ -26,6 +29,41 @@ def test_progress_map() -> None:
     assert result == [2, 4, 6, 8, 10]
 
 
+def test_progress_map_generator() -> None:
+    """Test progress_map consumes generators lazily."""
+    data = (x for x in range(5))
+    result = progress_map(lambda x: x + 1, data, desc="Testing map")
+
+    assert result == [1, 2, 3, 4, 5]
+
+
+def test_progress_map_thread_workers() -> None:
+    """Test progress_map with a thread pool keeps input order."""
+    data = (x for x in range(20))
+    result = progress_map(lambda x: x * x, data, workers=4)
+
+    assert result == [x * x for x in range(20)]
+
+
+def test_progress_map_process_workers() -> None:
+    """Test progress_map with a process pool."""
+    result = progress_map(
+        abs,
+        [-3, -2, -1, 0, 1],
+        workers=2,
+        executor="process",
+        chunksize=2
+    )
+
+    assert result == [3, 2, 1, 0, 1]
+
+
+def test_progress_map_unknown_executor() -> None:
+    """Test progress_map rejects unknown executor types."""
+    with pytest.raises(ValueError):
+        progress_map(abs, [1, 2], workers=2, executor="fiber")
+
+
 def test_progress_filter() -> None:
     """Test progress_filter function."""
     data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
@@ -55,12 +93,188 @@ def test_progress_copy() -> None:
         assert "Test content" in content
 
 
+def _assert_copy_roundtrip(size: int = 100 * 1024 + 123) -> None:
+    """Copy random data in 4 KiB chunks and check it arrives intact."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_file = os.path.join(tmpdir, "source.bin")
+        dst_file = os.path.join(tmpdir, "destination.bin")
+
+        data = os.urandom(size)
+        with open(src_file, 'wb') as out:
+            out.write(data)
+
+        progress_copy(src_file, dst_file, chunk_size=4096)
+
+        with open(dst_file, 'rb') as copied:
+            assert copied.read() == data
+
+
+def test_progress_copy_multiple_chunks() -> None:
+    """Test progress_copy on a file spanning many chunks."""
+    _assert_copy_roundtrip()
+
+
+def test_progress_copy_without_kernel_copy(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test progress_copy's user-space paths."""
+    monkeypatch.setattr(progress_wrappers, "_KERNEL_COPIES", [])
+
+    for size in (100, 100 * 1024 + 123):
+        _assert_copy_roundtrip(size)
+
+
+def test_progress_copy_handles_short_reads(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the pipelined copy keeps chunks in place on short reads."""
+    preadv = os.preadv
+
+    def short_preadv(fd: int, buffers: list, offset: int) -> int:
+        return preadv(fd, [buffers[0][:1000]], offset)
+
+    monkeypatch.setattr(progress_wrappers, "_KERNEL_COPIES", [])
+    monkeypatch.setattr(os, "preadv", short_preadv)
+
+    _assert_copy_roundtrip()
+
+
+def test_progress_copy_resumes_after_kernel_copy_error(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test progress_copy continues where a kernel copy gave up."""
+    def partial_copy(src_fd: int, dst_fd: int, count: int,
+                     offset: int) -> int:
+        if offset >= 8192:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return os.pwrite(dst_fd, os.pread(src_fd, count, offset), offset)
+
+    monkeypatch.setattr(
+        progress_wrappers, "_KERNEL_COPIES", [partial_copy]
+    )
+
+    _assert_copy_roundtrip()
+
+
+@pytest.mark.parametrize("reported_size", [0, 50 * 1024])
+def test_progress_copy_reads_past_reported_size(
+    monkeypatch: pytest.MonkeyPatch,
+    reported_size: int
+) -> None:
+    """Test progress_copy copies files larger than their stat size."""
+    monkeypatch.setattr(os.path, "getsize", lambda path: reported_size)
+
+    _assert_copy_roundtrip()
+
+
+def test_buffer_pool_reuses_released_buffers() -> None:
+    """Test the copy buffer pool hands released buffers back out."""
+    pool = progress_wrappers._BufferPool(max_bytes=2 * 4096)
+
+    first = pool.acquire(4096, 3)
+    pool.release(first)
+    second = pool.acquire(4096, 3)
+
+    assert sum(any(b is f for f in first) for b in second) == 2
+    assert all(len(b) == 4096 for b in second)
+
+    pool.release(second)
+    assert all(len(b) == 1024 for b in pool.acquire(1024, 2))
+
+    pool.release(second)
+    pool.clear()
+    assert not any(b is s for b in pool.acquire(4096, 2) for s in second)
+
+
 def test_progress_copy_file_not_found() -> None:
     """Test progress_copy with non-existent file."""
     with pytest.raises(FileNotFoundError):
         progress_copy("nonexistent.txt", "destination.txt")
 
 
+def test_progress_copytree() -> None:
+    """Test progress_copytree function."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_dir = os.path.join(tmpdir, "source")
+        dst_dir = os.path.join(tmpdir, "destination")
+        os.makedirs(os.path.join(src_dir, "nested", "deeper"))
+
+        rel_paths = [
+            "top.txt",
+            os.path.join("nested", "middle.txt"),
+            os.path.join("nested", "deeper", "bottom.txt"),
+        ]
+        for rel_path in rel_paths:
+            with open(os.path.join(src_dir, rel_path), 'w') as f:
+                f.write(f"Content of {rel_path}\n")
+
+        progress_copytree(src_dir, dst_dir, workers=2)
+
+        for rel_path in rel_paths:
+            with open(os.path.join(dst_dir, rel_path), 'r') as f:
+                assert f.read() == f"Content of {rel_path}\n"
+
+
+@pytest.mark.parametrize("fast_metadata", [True, False])
+def test_progress_copytree_preserves_metadata(fast_metadata: bool) -> None:
+    """Test progress_copytree copies file mode and timestamps."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_dir = os.path.join(tmpdir, "source")
+        dst_dir = os.path.join(tmpdir, "destination")
+        os.makedirs(src_dir)
+
+        src_file = os.path.join(src_dir, "script.sh")
+        with open(src_file, 'w') as f:
+            f.write("#!/bin/sh\n")
+        os.chmod(src_file, 0o750)
+        os.utime(src_file, ns=(1_000_000_000, 2_000_000_000))
+
+        progress_copytree(src_dir, dst_dir, fast_metadata=fast_metadata)
+
+        src_st = os.stat(src_file)
+        dst_st = os.stat(os.path.join(dst_dir, "script.sh"))
+        assert dst_st.st_mode == src_st.st_mode
+        assert dst_st.st_mtime_ns == src_st.st_mtime_ns
+
+
+@pytest.mark.parametrize("symlinks", [False, True])
+def test_progress_copytree_symlinked_dirs(symlinks: bool) -> None:
+    """Test progress_copytree only descends symlinked dirs on request."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_dir = os.path.join(tmpdir, "source")
+        dst_dir = os.path.join(tmpdir, "destination")
+        linked_dir = os.path.join(tmpdir, "linked")
+        os.makedirs(src_dir)
+        os.makedirs(linked_dir)
+        with open(os.path.join(linked_dir, "inner.txt"), 'w') as f:
+            f.write("inner\n")
+        os.symlink(linked_dir, os.path.join(src_dir, "link"))
+
+        progress_copytree(src_dir, dst_dir, symlinks=symlinks)
+
+        copied = os.path.join(dst_dir, "link", "inner.txt")
+        assert os.path.exists(copied) == symlinks
+
+
+def test_progress_copytree_source_is_file() -> None:
+    """Test progress_copytree copies nothing from a non-directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_file = os.path.join(tmpdir, "source.txt")
+        dst_dir = os.path.join(tmpdir, "destination")
+        with open(src_file, 'w') as f:
+            f.write("not a directory\n")
+
+        progress_copytree(src_file, dst_dir)
+
+        assert os.listdir(dst_dir) == []
+
+
+def test_progress_copytree_not_found() -> None:
+    """Test progress_copytree with non-existent directory."""
+    with pytest.raises(FileNotFoundError):
+        progress_copytree("nonexistent_dir", "destination_dir")
+
+
 def test_progress_reduce() -> None:
     """Test progress_reduce function."""
     data = [1, 2, 3, 4, 5]
@@ -74,6 +288,20 @@ def test_progress_reduce() -> None:
     assert result == 15
 
 
+def test_progress_reduce_without_initializer() -> None:
+    """Test progress_reduce seeded from the first item."""
+    data = (x for x in [2, 3, 4])
+    result = progress_reduce(lambda x, y: x * y, data, desc="Testing")
+
+    assert result == 24
+
+
+def test_progress_reduce_empty() -> None:
+    """Test progress_reduce on an empty iterable without initializer."""
+    with pytest.raises(TypeError):
+        progress_reduce(lambda x, y: x + y, [], desc="Testing reduce")
+
+
 def test_progress_enumerate() -> None:
     """Test progress_enumerate function."""
     data = ['a', 'b', 'c']
@@ -93,6 +321,15 @@ def test_progress_zip() -> None:
     assert result == [(1, 'a', 10), (2, 'b', 20), (3, 'c', 30)]
 
 
+def test_progress_zip_unequal_lengths() -> None:
+    """Test progress_zip stops at the shortest iterable."""
+    letters = (c for c in "abcdef")
+
+    result = progress_zip([1, 2, 3], letters, desc="Testing zip")
+
+    assert result == [(1, 'a'), (2, 'b'), (3, 'c')]
+
+
 def test_progress_context() -> None:
     """Test ProgressContext context manager."""
     with ProgressContext(total=10, desc="Testing context") as ctx:
@@ -111,3 +348,44 @@ def test_progress_context_description_update() -> None:
             ctx.update(1)
 
     assert True
+
+
+def test_progress_context_forwards_every_update() -> None:
+    """Test non-fast mode passes fractional and negative steps through."""
+    with ProgressContext(total=10, desc="Exact") as ctx:
+        ctx.update(0.5)
+        assert ctx.pbar.n == 0.5
+
+        ctx.update(3)
+        ctx.update(-1)
+        ctx.update(1)
+        assert ctx.pbar.n == 3.5
+
+
+def test_progress_context_fast() -> None:
+    """Test ProgressContext in fast mode."""
+    with ProgressContext(total=10000, desc="Fast", fast=True) as ctx:
+        assert ctx.pbar.miniters == 10
+        for _ in range(10000):
+            ctx.update(1)
+
+        assert ctx.pbar.n == 10000
+
+
+def test_progress_context_fast_without_total() -> None:
+    """Test fast mode accepts an unknown total."""
+    with ProgressContext(total=None, desc="Fast", fast=True) as ctx:
+        for _ in range(5):
+            ctx.update(1)
+
+        assert ctx.pbar.n == 5
+
+
+def test_progress_context_fast_flushes_on_exit() -> None:
+    """Test fast mode forwards the final partial batch."""
+    with ProgressContext(total=10000, desc="Fast", fast=True) as ctx:
+        for _ in range(15):
+            ctx.update(1)
+        assert ctx.pbar.n == 10
+
+    assert ctx.pbar.n == 15
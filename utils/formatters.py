@@ -5,10 +5,16 @@ This module provides custom formatting functions and styles
 for progress bars.
 """
 
-from typing import Any, Dict, Optional
+import functools
+import itertools
+import math
+from typing import Any, Dict, Optional, Tuple
 
 from tqdm import tqdm
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_LARGEST_UNIT_BYTES = 1 << (10 * (len(_BYTE_UNITS) - 1))
+
 
 def bytes_formatter(n: float, pos: Optional[int] = None) -> str:
     """
@@ -21,14 +27,18 @@ def bytes_formatter(n: float, pos: Optional[int] = None) -> str:
     Returns:
         Formatted string
     """
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
     unit_idx = 0
 
-    while n >= 1024 and unit_idx < len(units) - 1:
-        n /= 1024
-        unit_idx += 1
+    if n >= _LARGEST_UNIT_BYTES:
+        unit_idx = len(_BYTE_UNITS) - 1
+    elif n >= 1024:
+        # Each unit spans 10 bits, so the bit length picks it directly.
+        unit_idx = (int(n).bit_length() - 1) // 10
+
+    if unit_idx:
+        n /= 1 << (10 * unit_idx)
 
-    return f"{n:.2f} {units[unit_idx]}"
+    return f"{n:.2f} {_BYTE_UNITS[unit_idx]}"
 
 
 def percentage_formatter(n: float, total: float) -> str:
@@ -58,9 +68,23 @@ def time_formatter(seconds: float) -> str:
     Returns:
         Formatted time string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(math.floor(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """
+    Format a whole number of seconds, memoized across refreshes.
+
+    Args:
+        seconds: Duration in whole seconds
+
+    Returns:
+        Formatted time string
+    """
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
 
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
@@ -70,15 +94,15 @@ def time_formatter(seconds: float) -> str:
         return f"{secs}s"
 
 
-def create_custom_bar_format(
-    show_percentage: bool = True,
-    show_count: bool = True,
-    show_rate: bool = True,
-    show_elapsed: bool = True,
-    show_remaining: bool = True
+def _build_bar_format(
+    show_percentage: bool,
+    show_count: bool,
+    show_rate: bool,
+    show_elapsed: bool,
+    show_remaining: bool
 ) -> str:
     """
-    Create a custom bar format string.
+    Assemble a bar format string from the enabled sections.
 
     Args:
         show_percentage: Include percentage
@@ -115,6 +139,42 @@ def create_custom_bar_format(
     return ": ".join(parts[:2]) + " | " + " ".join(parts[2:])
 
 
+# Every combination of create_custom_bar_format's flags, built once.
+_BAR_FORMATS: Dict[Tuple[bool, ...], str] = {
+    flags: _build_bar_format(*flags)
+    for flags in itertools.product((False, True), repeat=5)
+}
+
+
+def create_custom_bar_format(
+    show_percentage: bool = True,
+    show_count: bool = True,
+    show_rate: bool = True,
+    show_elapsed: bool = True,
+    show_remaining: bool = True
+) -> str:
+    """
+    Create a custom bar format string.
+
+    Args:
+        show_percentage: Include percentage
+        show_count: Include current/total count
+        show_rate: Include processing rate
+        show_elapsed: Include elapsed time
+        show_remaining: Include remaining time
+
+    Returns:
+        Custom format string
+    """
+    return _BAR_FORMATS[(
+        bool(show_percentage),
+        bool(show_count),
+        bool(show_rate),
+        bool(show_elapsed),
+        bool(show_remaining),
+    )]
+
+
 class ColoredProgressBar(tqdm):
     """Progress bar with colored output based on progress."""
 
@@ -126,6 +186,10 @@ class ColoredProgressBar(tqdm):
         'reset': '\033[0m'
     }
 
+    # Colors for the <33%, <66% and remaining progress bands.
+    _BAND_COLORS = (COLORS['red'], COLORS['yellow'], COLORS['green'])
+    _RESET = COLORS['reset']
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize colored progress bar."""
         super().__init__(*args, **kwargs)
@@ -147,22 +211,23 @@ class ColoredProgressBar(tqdm):
         **extra_kwargs: Any
     ) -> str:
         """Format meter with color based on progress percentage."""
-        meter = super().format_meter(
+        meter: str = super().format_meter(
             n, total, elapsed, ncols, prefix, ascii,
             unit, unit_scale, rate, bar_format,
             postfix, unit_divisor, **extra_kwargs
         )
 
-        if total > 0:
-            progress = n / total
-            if progress < 0.33:
-                color = self.COLORS['red']
-            elif progress < 0.66:
-                color = self.COLORS['yellow']
+        if total and total > 0:
+            # Compare scaled integers rather than dividing n by total.
+            scaled = n * 100
+            if scaled < 33 * total:
+                band = 0
+            elif scaled < 66 * total:
+                band = 1
             else:
-                color = self.COLORS['green']
+                band = 2
 
-            return f"{color}{meter}{self.COLORS['reset']}"
+            return self._BAND_COLORS[band] + meter + self._RESET
 
         return meter
 
@@ -206,14 +271,11 @@ def create_metrics_display(metrics: Dict[str, Any]) -> str:
     Returns:
         Formatted metrics string
     """
-    parts = []
-    for key, value in metrics.items():
-        if isinstance(value, float):
-            parts.append(f"{key}={value:.4f}")
-        else:
-            parts.append(f"{key}={value}")
-
-    return ", ".join(parts)
+    return ", ".join(
+        f"{key}={value:.4f}" if isinstance(value, float)
+        else f"{key}={value}"
+        for key, value in metrics.items()
+    )
 
 
 def progress_bar_with_metrics(
@@ -5,38 +5,178 @@ This module provides convenient wrapper functions that add progress
 tracking to common operations.
 """
 
+import errno
+import functools
+import io
+import operator
 import os
 import shutil
-from typing import Any, Callable, Iterable, List, Optional
+import stat
+import threading
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from tqdm import tqdm
 
+# Number of chunk reads kept in flight by the pipelined file copy.
+_COPY_QUEUE_DEPTH = 4
+
+# Smallest chunk size progress_copy picks on its own; large enough
+# to keep NVMe devices busy.
+_MIN_COPY_CHUNK = 4 * 1024 * 1024
+
+# Pool types accepted by progress_map's ``executor`` argument.
+_EXECUTORS: Dict[str, Callable[..., Executor]] = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+class _BufferPool:
+    """
+    Copy buffers kept alive between progress_copy calls.
+
+    Batch pipelines call progress_copy many times in a row; handing
+    the same buffers back out avoids allocating and faulting in fresh
+    buffers for every file. Only buffers of the most recently released
+    size are retained, up to ``max_bytes`` in total.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = 0
+        self._free: List[bytearray] = []
+
+    def acquire(self, size: int, count: int) -> List[bytearray]:
+        """
+        Borrow ``count`` buffers of ``size`` bytes.
+
+        Args:
+            size: Length of each buffer in bytes
+            count: Number of buffers needed
+
+        Returns:
+            Buffers for exclusive use until released
+        """
+        with self._lock:
+            reused: List[bytearray] = []
+            if size == self._size:
+                while self._free and len(reused) < count:
+                    reused.append(self._free.pop())
+        return reused + [bytearray(size) for _ in range(count - len(reused))]
+
+    def release(self, buffers: List[bytearray]) -> None:
+        """
+        Return borrowed buffers to the pool.
+
+        Args:
+            buffers: Buffers previously obtained from acquire
+        """
+        if not buffers:
+            return
+        size = len(buffers[0])
+        with self._lock:
+            if size != self._size:
+                self._size = size
+                self._free = []
+            room = self._max_bytes // size - len(self._free)
+            self._free.extend(buffers[:max(0, room)])
+
+    def clear(self) -> None:
+        """Drop every retained buffer."""
+        with self._lock:
+            self._free = []
+
+
+# Buffers reused by the user-space copy paths, which serve sources
+# the kernel copies cannot handle and the final read to EOF.
+_BUFFER_POOL = _BufferPool(max_bytes=2 * _MIN_COPY_CHUNK)
+
+
+def _length_hint(iterable: Iterable[Any]) -> Optional[int]:
+    """
+    Estimate the length of an iterable without consuming it.
+
+    Args:
+        iterable: Iterable to inspect
+
+    Returns:
+        Estimated number of items, or None if unknown
+    """
+    hint = operator.length_hint(iterable, -1)
+    return hint if hint >= 0 else None
+
 
 def progress_map(
     func: Callable[[Any], Any],
     iterable: Iterable[Any],
     desc: str = "Processing",
+    workers: int = 1,
+    executor: str = "thread",
+    chunksize: int = 1,
     **tqdm_kwargs: Any
 ) -> List[Any]:
     """
     Apply function to iterable with progress tracking.
 
+    With more than one worker, items are dispatched through a thread
+    or process pool and results are returned in input order.
+
     Args:
         func: Function to apply to each item
         iterable: Iterable to process
         desc: Description for progress bar
+        workers: Number of parallel workers
+        executor: Pool type, either 'thread' or 'process'
+        chunksize: Items sent to a process worker per task
         **tqdm_kwargs: Additional arguments for tqdm
 
     Returns:
         List of results
-    """
-    items = list(iterable)
-    results = []
 
-    for item in tqdm(items, desc=desc, **tqdm_kwargs):
-        results.append(func(item))
-
-    return results
+    Raises:
+        ValueError: If executor is not a known pool type
+    """
+    if workers <= 1:
+        tqdm_kwargs.setdefault('total', _length_hint(iterable))
+        return list(map(func, tqdm(iterable, desc=desc, **tqdm_kwargs)))
+
+    if executor not in _EXECUTORS:
+        raise ValueError(
+            f"Unknown executor: {executor!r} "
+            f"(expected one of {sorted(_EXECUTORS)})"
+        )
+
+    if tqdm_kwargs.get('total') is None:
+        tqdm_kwargs['total'] = _length_hint(iterable)
+        if tqdm_kwargs['total'] is None:
+            iterable = list(iterable)
+            tqdm_kwargs['total'] = len(iterable)
+
+    with _EXECUTORS[executor](max_workers=workers) as pool:
+        return list(tqdm(
+            pool.map(func, iterable, chunksize=chunksize),
+            desc=desc,
+            **tqdm_kwargs
+        ))
 
 
 def progress_filter(
@@ -57,33 +197,231 @@ def progress_filter(
     Returns:
         List of filtered items
     """
-    items = list(iterable)
-    results = []
+    tqdm_kwargs.setdefault('total', _length_hint(iterable))
+
+    return list(filter(
+        predicate,
+        tqdm(iterable, desc=desc, **tqdm_kwargs)
+    ))
+
+
+def _preferred_chunk_size(path: str) -> int:
+    """
+    Pick a copy chunk size suited to the file's storage.
+
+    Args:
+        path: File whose filesystem is probed
+
+    Returns:
+        At least _MIN_COPY_CHUNK bytes, rounded up to a whole number
+        of the filesystem's preferred I/O blocks
+    """
+    block_size = getattr(os.stat(path), 'st_blksize', 0) or 1
+    return -(-_MIN_COPY_CHUNK // block_size) * block_size
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, count: int, offset: int) -> int:
+    """Copy bytes at ``offset`` between regular files in the kernel."""
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int, offset: int) -> int:
+    """Copy bytes at ``offset`` to the destination's current position."""
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+# In-kernel copy primitives available on this platform, best first.
+_KERNEL_COPIES: List[Callable[[int, int, int, int], int]] = [
+    func
+    for name, func in (
+        ('copy_file_range', _copy_file_range),
+        ('sendfile', _sendfile),
+    )
+    if hasattr(os, name)
+]
+
+# Errors meaning a kernel copy primitive cannot handle these files.
+_KERNEL_COPY_ERRNOS = frozenset({
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+    errno.EXDEV,
+})
+
+
+def _copy_in_kernel(
+    src_fd: int,
+    dst_fd: int,
+    file_size: int,
+    chunk_size: int,
+    pbar: tqdm
+) -> int:
+    """
+    Copy file data without passing it through user space.
+
+    Tries each primitive in _KERNEL_COPIES in turn, resuming where the
+    previous one stopped.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        file_size: Number of bytes to copy
+        chunk_size: Bytes copied per call between progress updates
+        pbar: Progress bar to advance by the bytes copied
+
+    Returns:
+        Number of bytes copied; less than file_size if no primitive
+        could finish the copy
+    """
+    copied = 0
+
+    for copy in _KERNEL_COPIES:
+        # sendfile writes at the descriptor's own file position.
+        os.lseek(dst_fd, copied, os.SEEK_SET)
+        try:
+            while copied < file_size:
+                n = copy(src_fd, dst_fd, chunk_size, copied)
+                if not n:
+                    return copied
+                copied += n
+                pbar.update(n)
+            return copied
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_ERRNOS:
+                raise
+
+    return copied
+
+
+def _copy_chunks(
+    fsrc: io.BufferedReader,
+    fdst: BinaryIO,
+    chunk_size: int,
+    pbar: tqdm
+) -> None:
+    """
+    Copy one chunk at a time through a single reused buffer.
 
-    for item in tqdm(items, desc=desc, **tqdm_kwargs):
-        if predicate(item):
-            results.append(item)
+    Args:
+        fsrc: Source file opened for binary reading
+        fdst: Destination file opened for binary writing
+        chunk_size: Size of each chunk in bytes
+        pbar: Progress bar to advance by the bytes written
+    """
+    borrowed = _BUFFER_POOL.acquire(chunk_size, 1)
+    try:
+        buffer = memoryview(borrowed[0])
+        while True:
+            n = fsrc.readinto(buffer)
+            if not n:
+                break
+            fdst.write(buffer[:n])
+            pbar.update(n)
+    finally:
+        _BUFFER_POOL.release(borrowed)
+
+
+def _copy_pipelined(
+    src_fd: int,
+    fdst: BinaryIO,
+    file_size: int,
+    chunk_size: int,
+    pbar: tqdm,
+    start: int = 0,
+    depth: int = _COPY_QUEUE_DEPTH
+) -> int:
+    """
+    Copy with several positional reads in flight at once.
 
-    return results
+    Reads are issued with os.preadv from a small thread pool into a
+    ring of ``depth`` buffers borrowed from the shared buffer pool,
+    so the device keeps up to ``depth`` requests queued while the
+    calling thread writes completed chunks out in order.
+
+    Args:
+        src_fd: Source file descriptor
+        fdst: Destination file opened for binary writing
+        file_size: Number of bytes to copy
+        chunk_size: Size of each chunk in bytes
+        pbar: Progress bar to advance by the bytes written
+        start: Offset to start copying from
+        depth: Maximum number of outstanding reads
+
+    Returns:
+        Offset the copy stopped at, short of file_size if the source
+        ended early
+    """
+    borrowed = _BUFFER_POOL.acquire(chunk_size, depth)
+    pending: Deque[Tuple[int, memoryview, "Future[int]"]] = deque()
+    copied = start
+
+    def write_oldest() -> bool:
+        nonlocal copied
+        offset, buffer, future = pending.popleft()
+        n = future.result()
+        expected = min(chunk_size, file_size - offset)
+        # Top up short reads so later chunks are not shifted in the
+        # output; a read returning nothing means the source ended.
+        while 0 < n < expected:
+            more = os.preadv(src_fd, [buffer[n:expected]], offset + n)
+            if not more:
+                break
+            n += more
+        fdst.write(buffer[:n])
+        pbar.update(n)
+        copied += n
+        return n == expected
+
+    try:
+        with ThreadPoolExecutor(max_workers=depth) as pool:
+            complete = True
+            offsets = range(start, file_size, chunk_size)
+            for index, offset in enumerate(offsets):
+                # The buffer for this read is free once the read that
+                # used it ``depth`` chunks ago has been written.
+                if len(pending) >= depth:
+                    complete = write_oldest()
+                    if not complete:
+                        break
+                buffer = memoryview(borrowed[index % depth])
+                future = pool.submit(os.preadv, src_fd, [buffer], offset)
+                pending.append((offset, buffer, future))
+
+            while complete and pending:
+                complete = write_oldest()
+    finally:
+        _BUFFER_POOL.release(borrowed)
+
+    return copied
 
 
 def progress_copy(
     src: str,
     dst: str,
-    chunk_size: int = 1024 * 1024
+    chunk_size: Optional[int] = None
 ) -> None:
     """
     Copy file with progress tracking.
 
+    Data is copied inside the kernel with copy_file_range or sendfile
+    where possible. Otherwise files spanning at least two chunks are
+    copied with a pipeline of concurrent reads where os.preadv is
+    available. Anything past the size reported for the source is
+    read until end of file.
+
     Args:
         src: Source file path
         dst: Destination file path
-        chunk_size: Size of each chunk in bytes
+        chunk_size: Size of each chunk in bytes (derived from the
+            source filesystem's block size if None)
     """
     if not os.path.exists(src):
         raise FileNotFoundError(f"Source file not found: {src}")
 
     file_size = os.path.getsize(src)
+    if chunk_size is None:
+        chunk_size = _preferred_chunk_size(src)
 
     with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
         with tqdm(
@@ -92,45 +430,156 @@ def progress_copy(
             unit_scale=True,
             desc=f"Copying {os.path.basename(src)}"
         ) as pbar:
-            while True:
-                chunk = fsrc.read(chunk_size)
-                if not chunk:
-                    break
-                fdst.write(chunk)
-                pbar.update(len(chunk))
+            copied = _copy_in_kernel(
+                fsrc.fileno(), fdst.fileno(), file_size, chunk_size, pbar
+            )
+            fsrc.seek(copied)
+            fdst.seek(copied)
+
+            # A pipeline cannot overlap anything for a single chunk.
+            remaining = file_size - copied
+            if hasattr(os, 'preadv') and remaining >= 2 * chunk_size:
+                if hasattr(os, 'posix_fadvise'):
+                    # Let kernel read-ahead fetch pages before the
+                    # reads for them are even submitted.
+                    os.posix_fadvise(
+                        fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                    )
+                copied = _copy_pipelined(
+                    fsrc.fileno(), fdst, file_size, chunk_size, pbar,
+                    start=copied
+                )
+                fsrc.seek(copied)
+
+            # The reported size is only a hint: procfs and sysfs files
+            # report 0 and files may grow, so finish reading to EOF.
+            _copy_chunks(fsrc, fdst, chunk_size, pbar)
+
+
+def _iter_tree_files(
+    src_dir: str,
+    dst_dir: str,
+    follow_symlinks: bool = False
+) -> Iterator[Tuple["os.DirEntry[str]", str]]:
+    """
+    Yield the entry and destination path of every file below src_dir.
+
+    Uses os.scandir so entry types come from the directory listing
+    itself. Like os.walk, directories that cannot be listed are
+    skipped and symlinked directories are only descended into when
+    following symlinks.
+
+    Args:
+        src_dir: Directory to enumerate
+        dst_dir: Directory mirroring src_dir in the copy
+        follow_symlinks: Descend into symlinked directories
+
+    Yields:
+        (source entry, destination path) tuples
+    """
+    try:
+        entries = os.scandir(src_dir)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            dst_path = os.path.join(dst_dir, entry.name)
+            if entry.is_dir():
+                if follow_symlinks or not entry.is_symlink():
+                    yield from _iter_tree_files(
+                        entry.path, dst_path, follow_symlinks
+                    )
+            else:
+                yield entry, dst_path
+
+
+def _copy_tree_file(
+    entry: "os.DirEntry[str]",
+    dst: str,
+    fast_metadata: bool,
+    preserve_owner: bool
+) -> None:
+    """
+    Copy one file of a tree along with its metadata.
+
+    In fast mode the data goes through shutil.copyfile and only mode
+    and timestamps are applied, from the stat cached on the directory
+    entry, instead of shutil.copy2 stating the source again and
+    copying extended attributes and flags.
+
+    Args:
+        entry: Directory entry of the source file
+        dst: Destination file path
+        fast_metadata: Copy only mode and timestamps
+        preserve_owner: Also copy ownership and extended attributes
+    """
+    if fast_metadata and not preserve_owner:
+        st = entry.stat()
+        shutil.copyfile(entry.path, dst)
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        shutil.copy2(entry.path, dst)
+
+    if preserve_owner:
+        st = entry.stat()
+        os.chown(dst, st.st_uid, st.st_gid)
 
 
 def progress_copytree(
     src: str,
     dst: str,
     symlinks: bool = False,
-    ignore: Optional[Callable[[str, List[str]], List[str]]] = None
+    ignore: Optional[Callable[[str, List[str]], List[str]]] = None,
+    workers: int = 8,
+    fast_metadata: bool = False,
+    preserve_owner: bool = False
 ) -> None:
     """
     Copy directory tree with progress tracking.
 
+    Files are copied by a thread pool; the data copy releases the GIL,
+    so several copies proceed at once.
+
     Args:
         src: Source directory
         dst: Destination directory
-        symlinks: Follow symbolic links
+        symlinks: Follow symbolic links to directories
         ignore: Function to filter files to ignore
+        workers: Number of files copied concurrently
+        fast_metadata: Copy only mode and timestamps, from the stat
+            cached on each directory entry, instead of using
+            shutil.copy2
+        preserve_owner: Also copy ownership and extended attributes
     """
     if not os.path.exists(src):
         raise FileNotFoundError(f"Source directory not found: {src}")
 
-    file_list = []
-    for root, dirs, files in os.walk(src):
-        for file in files:
-            file_list.append(os.path.join(root, file))
+    entry_list = []
+    dst_list = []
+    for entry, dst_file in _iter_tree_files(src, dst, symlinks):
+        entry_list.append(entry)
+        dst_list.append(dst_file)
 
     os.makedirs(dst, exist_ok=True)
+    for dst_dir in {os.path.dirname(dst_file) for dst_file in dst_list}:
+        os.makedirs(dst_dir, exist_ok=True)
 
-    for src_file in tqdm(file_list, desc="Copying files", unit="file"):
-        rel_path = os.path.relpath(src_file, src)
-        dst_file = os.path.join(dst, rel_path)
+    copy_file = functools.partial(
+        _copy_tree_file,
+        fast_metadata=fast_metadata,
+        preserve_owner=preserve_owner
+    )
 
-        os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-        shutil.copy2(src_file, dst_file)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for _ in tqdm(
+            pool.map(copy_file, entry_list, dst_list),
+            total=len(entry_list),
+            desc="Copying files",
+            unit="file"
+        ):
+            pass
 
 
 def progress_reduce(
@@ -153,20 +602,23 @@ def progress_reduce(
     Returns:
         Reduced result
     """
-    items = list(iterable)
+    items = iter(iterable)
 
     if initializer is None:
-        if not items:
-            raise TypeError("reduce() of empty sequence")
-        result = items[0]
-        items = items[1:]
+        try:
+            result = next(items)
+        except StopIteration:
+            raise TypeError("reduce() of empty sequence") from None
     else:
         result = initializer
 
-    for item in tqdm(items, desc=desc, **tqdm_kwargs):
-        result = func(result, item)
+    tqdm_kwargs.setdefault('total', _length_hint(items))
 
-    return result
+    return functools.reduce(
+        func,
+        tqdm(items, desc=desc, **tqdm_kwargs),
+        result
+    )
 
 
 def progress_enumerate(
@@ -187,16 +639,12 @@ def progress_enumerate(
     Returns:
         List of (index, item) tuples
     """
-    items = list(iterable)
-    results = []
+    tqdm_kwargs.setdefault('total', _length_hint(iterable))
 
-    for idx, item in enumerate(
-        tqdm(items, desc=desc, **tqdm_kwargs),
+    return list(enumerate(
+        tqdm(iterable, desc=desc, **tqdm_kwargs),
         start=start
-    ):
-        results.append((idx, item))
-
-    return results
+    ))
 
 
 def progress_zip(
@@ -215,14 +663,13 @@ def progress_zip(
     Returns:
         List of tuples
     """
-    lists = [list(it) for it in iterables]
-    min_length = min(len(lst) for lst in lists)
+    # An unsized iterable hints 0, which leaves the total unknown.
+    tqdm_kwargs.setdefault('total', min(
+        (operator.length_hint(it, 0) for it in iterables),
+        default=0
+    ) or None)
 
-    results = []
-    for i in tqdm(range(min_length), desc=desc, **tqdm_kwargs):
-        results.append(tuple(lst[i] for lst in lists))
-
-    return results
+    return list(tqdm(zip(*iterables), desc=desc, **tqdm_kwargs))
 
 
 class ProgressContext:
@@ -230,18 +677,32 @@ class ProgressContext:
 
     def __init__(
         self,
-        total: int,
+        total: Optional[int],
         desc: str = "Progress",
+        fast: bool = False,
         **tqdm_kwargs: Any
     ) -> None:
         """
         Initialize progress context.
 
         Args:
-            total: Total number of steps
+            total: Total number of steps, or None if unknown
             desc: Description for progress bar
+            fast: Count updates locally and pass them to tqdm only
+                every 0.1% of total, for callers that update millions
+                of times; without a total every update is passed on
             **tqdm_kwargs: Additional arguments for tqdm
         """
+        self._fast = fast
+        self._batch = max(1, (total or 0) // 1000) if fast else 1
+        self._pending: float = 0
+
+        tqdm_kwargs.setdefault('mininterval', 0.1)
+        tqdm_kwargs.setdefault('maxinterval', 1.0)
+        tqdm_kwargs.setdefault('smoothing', 0.1)
+        if fast:
+            tqdm_kwargs.setdefault('miniters', self._batch)
+
         self.pbar = tqdm(total=total, desc=desc, **tqdm_kwargs)
 
     def __enter__(self) -> 'ProgressContext':
@@ -250,16 +711,30 @@ class ProgressContext:
 
     def __exit__(self, *args: Any) -> None:
         """Exit context and close progress bar."""
+        self.flush()
         self.pbar.close()
 
-    def update(self, n: int = 1) -> None:
+    def update(self, n: float = 1) -> None:
         """
         Update progress.
 
         Args:
             n: Number of steps to increment
         """
-        self.pbar.update(n)
+        if not self._fast:
+            self.pbar.update(n)
+            return
+
+        self._pending += n
+        if self._pending >= self._batch:
+            self.pbar.update(self._pending)
+            self._pending = 0
+
+    def flush(self) -> None:
+        """Pass any locally counted steps on to the progress bar."""
+        if self._pending:
+            self.pbar.update(self._pending)
+            self._pending = 0
 
     def set_description(self, desc: str) -> None:
         """
@@ -268,6 +743,7 @@ class ProgressContext:
         Args:
             desc: New description
         """
+        self.flush()
         self.pbar.set_description(desc)
 
     def set_postfix(self, **kwargs: Any) -> None:
@@ -277,4 +753,5 @@ class ProgressContext:
         Args:
             **kwargs: Key-value pairs for postfix
         """
+        self.flush()
         self.pbar.set_postfix(**kwargs)